@@ -13,6 +13,7 @@ from modules.data_processor import (
     process_query_and_update_sheets,
 )
 from modules.gsheet_handler import fetch_google_sheet_data, update_google_sheet
+from config import RETRIEVER_BACKEND, RETRIEVER_BACKENDS
 import pandas as pd
 import tempfile
 
@@ -45,7 +46,7 @@ def preview_columns(file=None, credentials=None, sheet_id=None, sheet_name=None)
         return str(e), []
 
 
-def process_data(file=None, credentials=None, sheet_id=None, sheet_name=None, query_template=None):
+def process_data(file=None, credentials=None, sheet_id=None, sheet_name=None, query_template=None, backend=RETRIEVER_BACKEND):
     """
     Process data from a CSV file or Google Sheet using a query template.
     
@@ -55,6 +56,7 @@ def process_data(file=None, credentials=None, sheet_id=None, sheet_name=None, qu
         sheet_id: The Google Sheet ID.
         sheet_name: The name of the specific worksheet/tab in the Google Sheet.
         query_template: A template query string for processing data.
+        backend: The retriever backend to use ("lexical", "vector" or "hybrid").
 
     Returns:
         A tuple containing:
@@ -63,10 +65,10 @@ def process_data(file=None, credentials=None, sheet_id=None, sheet_name=None, qu
     """
     try:
         if file:
-            updated_df = process_query_and_update_csv(file.name, query_template)
+            updated_df = process_query_and_update_csv(file.name, query_template, backend)
         elif credentials and sheet_id and sheet_name:
             df = fetch_google_sheet_data(credentials.name, sheet_id, sheet_name)
-            updated_df = process_query_and_update_sheets(credentials.name, df, query_template)
+            updated_df = process_query_and_update_sheets(credentials.name, df, query_template, backend)
         else:
             return pd.DataFrame(), "No data source provided"
         
@@ -118,6 +120,7 @@ def build_csv_tab():
 
         csv_file = gr.File(label="Upload CSV File")
         query_template_csv = gr.Textbox(label="CSV Query Template (e.g., 'Get me the name of CEO of {Company}')")
+        backend_csv = gr.Dropdown(choices=list(RETRIEVER_BACKENDS), value=RETRIEVER_BACKEND, label="Retriever Backend")
         with gr.Row():
             preview_button_csv = gr.Button("Preview Columns")
             process_button_csv = gr.Button("Process Queries")
@@ -133,7 +136,7 @@ def build_csv_tab():
         )
         process_button_csv.click(
             process_data,
-            inputs=[csv_file, gr.State(None), gr.State(None), gr.State(None), query_template_csv],
+            inputs=[csv_file, gr.State(None), gr.State(None), gr.State(None), query_template_csv, backend_csv],
             outputs=[processed_output_csv, download_button_csv],
         )
 
@@ -171,6 +174,7 @@ def build_google_sheets_tab():
         sheet_id = gr.Textbox(label="Google Sheet ID")
         sheet_name = gr.Textbox(label="Google Sheet Name (e.g., Sheet1)")
         query_template_sheet = gr.Textbox(label="Query Template (e.g., 'Get me the name of CEO of {Company}')")
+        backend_sheet = gr.Dropdown(choices=list(RETRIEVER_BACKENDS), value=RETRIEVER_BACKEND, label="Retriever Backend")
         with gr.Row():
             preview_button_sheet = gr.Button("Preview Columns")
             process_button_sheet = gr.Button("Process Queries")
@@ -188,7 +192,7 @@ def build_google_sheets_tab():
         )
         process_button_sheet.click(
             process_data,
-            inputs=[gr.State(None), credentials, sheet_id, sheet_name, query_template_sheet],
+            inputs=[gr.State(None), credentials, sheet_id, sheet_name, query_template_sheet, backend_sheet],
             outputs=[processed_output_sheet, download_button_sheet],
         )
         update_button.click(
@@ -1,5 +1,17 @@
 import os
+from dotenv import load_dotenv
+
+# Load .env before reading any settings so they can be configured there
+load_dotenv()
+
 api_key = os.getenv("SERPAPI_KEY")
 
 # Directory to persist embeddings with ChromaDB
 PERSIST_DIRECTORY = "./chroma_db"
+
+# Retriever backend used for the QA step: "lexical" (BM25, no network calls),
+# "vector" (OpenAI embeddings + Chroma) or "hybrid" (both, rank-fused)
+RETRIEVER_BACKENDS = ("lexical", "vector", "hybrid")
+RETRIEVER_BACKEND = os.getenv("RETRIEVER_BACKEND", "vector")
+if RETRIEVER_BACKEND not in RETRIEVER_BACKENDS:
+    raise ValueError(f"Invalid RETRIEVER_BACKEND '{RETRIEVER_BACKEND}'. Expected one of: {', '.join(RETRIEVER_BACKENDS)}.")
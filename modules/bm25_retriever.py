@@ -0,0 +1,104 @@
+"""
+BM25 Retriever Module
+
+This module provides an embedding-free lexical retriever for the QA step. The index is built
+locally from LangChain Document objects with NumPy, so retrieval makes no network calls.
+
+Functions:
+- tokenize: Splits text into lowercase alphanumeric tokens.
+
+Classes:
+- BM25Retriever: Okapi BM25 retriever over an in-memory term-frequency matrix.
+"""
+
+import re
+from typing import Any, List
+
+import numpy as np
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+
+def tokenize(text):
+    """
+    Splits text into lowercase alphanumeric tokens for lexical matching.
+    Args:
+        text (str): The text to tokenize.
+    Returns:
+        list: The list of tokens.
+    """
+    return re.findall(r"\w+", text.lower())
+
+
+class BM25Retriever(BaseRetriever):
+    """
+    Okapi BM25 retriever built locally from Document objects.
+    Scoring is done with NumPy over an in-memory term-frequency matrix,
+    so retrieval needs no embeddings and no network calls.
+    """
+
+    documents: List[Document]
+    vocabulary: dict
+    term_freqs: Any
+    doc_lengths: Any
+    idf: Any
+    k: int = 5
+    k1: float = 1.5
+    b: float = 0.75
+
+    @classmethod
+    def from_documents(cls, documents, **kwargs):
+        """
+        Builds the BM25 index from a list of documents.
+        Args:
+            documents (list): The Document objects to index.
+            **kwargs: Extra retriever fields such as k, k1 or b.
+        Returns:
+            BM25Retriever: The retriever object.
+        """
+        tokenized = [tokenize(doc.page_content) for doc in documents]
+        vocabulary = {}
+        for tokens in tokenized:
+            for token in tokens:
+                vocabulary.setdefault(token, len(vocabulary))
+
+        term_freqs = np.zeros((len(documents), len(vocabulary)))
+        for row, tokens in enumerate(tokenized):
+            for token in tokens:
+                term_freqs[row, vocabulary[token]] += 1
+
+        n_docs = len(documents)
+        doc_freqs = np.count_nonzero(term_freqs, axis=0)
+        idf = np.log((n_docs - doc_freqs + 0.5) / (doc_freqs + 0.5) + 1.0)
+
+        return cls(
+            documents=documents,
+            vocabulary=vocabulary,
+            term_freqs=term_freqs,
+            doc_lengths=term_freqs.sum(axis=1),
+            idf=idf,
+            **kwargs,
+        )
+
+    def get_scores(self, query):
+        """
+        Computes the BM25 score of every indexed document for a query.
+        Args:
+            query (str): The query text.
+        Returns:
+            numpy.ndarray: One score per document.
+        """
+        columns = [self.vocabulary[token] for token in tokenize(query) if token in self.vocabulary]
+        if not columns:
+            return np.zeros(len(self.documents))
+
+        avg_length = self.doc_lengths.mean() or 1.0
+        freqs = self.term_freqs[:, columns]
+        norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[:, None] / avg_length)
+        return (self.idf[columns] * freqs * (self.k1 + 1) / (freqs + norm)).sum(axis=1)
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        scores = self.get_scores(query)
+        top = np.argsort(-scores, kind="stable")[: self.k]
+        return [self.documents[i] for i in top]
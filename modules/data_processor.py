@@ -14,8 +14,8 @@ Functions:
 import re
 import pandas as pd
 from modules.scraper import get_raw_data, get_raw_data_sheets
-from modules.embedding_storage import process_safety_with_chroma
-from modules.qa_chatbot import create_chatbot, ask_question
+from modules.qa_chatbot import create_retriever, create_chatbot, ask_question
+from config import RETRIEVER_BACKEND
 
 
 def extract_column_name(query_template):
@@ -37,13 +37,14 @@ def extract_column_name(query_template):
     return match.group(1)
 
 
-def process_query_and_update_csv(file_path, query_template):
+def process_query_and_update_csv(file_path, query_template, backend=RETRIEVER_BACKEND):
     """
     Process queries in a CSV file and update it by adding an 'Answer' column.
 
     Args:
         file_path (str): Path to the CSV file to be processed.
         query_template (str): The query template containing a placeholder for column names.
+        backend (str): The retriever backend to use ("lexical", "vector" or "hybrid").
 
     Returns:
         pd.DataFrame: The updated DataFrame with the 'Answer' column.
@@ -66,17 +67,16 @@ def process_query_and_update_csv(file_path, query_template):
         
         # Process the query using provided functions
         raw_data = get_raw_data(file_path, query)
-        vector_store = process_safety_with_chroma(raw_data)
-        qa_system = create_chatbot(vector_store)
-        prompt = f"Give me the exact answer for this below query '{query}' in a structured format with a link from the content provided only."
-        answer = ask_question(qa_system, prompt)
+        retriever = create_retriever(raw_data, backend)
+        qa_system = create_chatbot(retriever=retriever)
+        answer = ask_question(qa_system, query)
         df.at[index, "Answer"] = answer
 
     df.to_csv(file_path, index=False)
     return df
 
 
-def process_query_and_update_sheets(file_path, df, query_template):
+def process_query_and_update_sheets(file_path, df, query_template, backend=RETRIEVER_BACKEND):
     """
     Process queries in a Google Sheet and update the DataFrame by adding an 'Answer' column.
 
@@ -84,6 +84,7 @@ def process_query_and_update_sheets(file_path, df, query_template):
         file_path (str): Path to the temporary file (not used directly here).
         df (pd.DataFrame): The DataFrame representing Google Sheet data.
         query_template (str): The query template containing a placeholder for column names.
+        backend (str): The retriever backend to use ("lexical", "vector" or "hybrid").
 
     Returns:
         pd.DataFrame: The updated DataFrame with the 'Answer' column.
@@ -105,10 +106,9 @@ def process_query_and_update_sheets(file_path, df, query_template):
         
         # Process the query using provided functions
         raw_data = get_raw_data_sheets(query)
-        vector_store = process_safety_with_chroma(raw_data)
-        qa_system = create_chatbot(vector_store)
-        prompt = f"Give me the exact answer for this below query '{query}' in a structured format with a link from the content provided only."
-        answer = ask_question(qa_system, prompt)
+        retriever = create_retriever(raw_data, backend)
+        qa_system = create_chatbot(retriever=retriever)
+        answer = ask_question(qa_system, query)
         df.at[index, "Answer"] = answer
     
     return df
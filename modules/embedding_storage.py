@@ -5,6 +5,8 @@ This module processes structured JSON data into a Chroma vector store using Lang
 It handles data formatting, text splitting, and metadata extraction before creating embeddings.
 
 Functions:
+- build_documents: Converts JSON data into LangChain Document objects with metadata.
+- create_chroma_store: Embeds Document objects into a Chroma vector store.
 - process_safety_with_chroma: Converts JSON data into a Chroma vector store for efficient query handling.
 """
 
@@ -15,16 +17,16 @@ from langchain.docstore.document import Document
 from config import PERSIST_DIRECTORY
 
 
-def process_safety_with_chroma(data):
+def build_documents(data):
     """
-    Processes and stores the given structured JSON data into ChromaDB.
+    Converts the given structured JSON data into LangChain Document objects.
 
     Args:
         data (list): A list of dictionaries containing structured JSON data. 
             Each dictionary should include keys like 'snippet', 'snippet_highlighted_words', 'title', 'link', etc.
 
     Returns:
-        Chroma: The Chroma vector store object containing the processed embeddings.
+        list: A list of Document objects, one per item with a non-empty snippet.
 
     Raises:
         ValueError: If the data list is empty or invalid.
@@ -59,8 +61,35 @@ def process_safety_with_chroma(data):
     if not documents:
         raise ValueError("No valid documents were created from the provided data.")
 
-    # Initialize embeddings and Chroma store
+    return documents
+
+
+def create_chroma_store(documents):
+    """
+    Embeds the given documents into ChromaDB using OpenAI embeddings.
+
+    Args:
+        documents (list): A list of Document objects to embed.
+
+    Returns:
+        Chroma: The Chroma vector store object containing the processed embeddings.
+    """
     embeddings = OpenAIEmbeddings()
-    vector_store = Chroma.from_documents(documents, embeddings, persist_directory=PERSIST_DIRECTORY)
+    return Chroma.from_documents(documents, embeddings, persist_directory=PERSIST_DIRECTORY)
+
 
-    return vector_store
+def process_safety_with_chroma(data):
+    """
+    Processes and stores the given structured JSON data into ChromaDB.
+
+    Args:
+        data (list): A list of dictionaries containing structured JSON data. 
+            Each dictionary should include keys like 'snippet', 'snippet_highlighted_words', 'title', 'link', etc.
+
+    Returns:
+        Chroma: The Chroma vector store object containing the processed embeddings.
+
+    Raises:
+        ValueError: If the data list is empty or invalid.
+    """
+    return create_chroma_store(build_documents(data))
@@ -1,23 +1,107 @@
+from typing import List
+
 from langchain.chains import RetrievalQA
+from langchain.retrievers import EnsembleRetriever
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.prompts import PromptTemplate
+from langchain_core.retrievers import BaseRetriever
 from langchain_openai import OpenAI
 from langchain_chroma import Chroma
 
-def create_chatbot(vector_store):
+from config import RETRIEVER_BACKEND, RETRIEVER_BACKENDS
+from modules.bm25_retriever import BM25Retriever
+from modules.embedding_storage import build_documents, create_chroma_store, process_safety_with_chroma
+
+# Number of snippets each retriever hands to the LLM
+TOP_K = 5
+
+# The instruction lives in the chain prompt so retrievers only ever see the bare query
+QA_PROMPT = PromptTemplate.from_template(
+    "Use the following pieces of context to answer the question at the end.\n\n"
+    "{context}\n\n"
+    "Give me the exact answer for this below query '{question}' in a structured format "
+    "with a link from the content provided only.\n"
+    "Answer:"
+)
+
+
+class TopKRetriever(BaseRetriever):
+    """
+    Caps the results of another retriever at k documents, so fused
+    hybrid results hand the LLM as many snippets as a single backend.
     """
-    Creates a chatbot for querying the Chroma vector store.
+
+    retriever: BaseRetriever
+    k: int = TOP_K
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        documents = self.retriever.invoke(query, config={"callbacks": run_manager.get_child()})
+        return documents[: self.k]
+
+
+def create_vector_retriever(vector_store):
+    """
+    Creates an MMR retriever over the Chroma vector store.
     Args:
         vector_store (Chroma): The vector store to use.
+    Returns:
+        VectorStoreRetriever: The retriever object.
+    """
+    return vector_store.as_retriever(search_type="mmr", search_kwargs={"k": TOP_K})
+
+
+def create_retriever(data, backend=RETRIEVER_BACKEND):
+    """
+    Creates a retriever over the given structured JSON data.
+    Args:
+        data (list): A list of dictionaries containing structured JSON data.
+        backend (str): One of "lexical" (BM25), "vector" (Chroma) or "hybrid".
+    Returns:
+        BaseRetriever: The retriever object.
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    if backend not in RETRIEVER_BACKENDS:
+        raise ValueError(f"Unsupported retriever backend '{backend}'. Expected one of: {', '.join(RETRIEVER_BACKENDS)}.")
+
+    if backend == "vector":
+        return create_vector_retriever(process_safety_with_chroma(data))
+
+    documents = build_documents(data)
+    lexical = BM25Retriever.from_documents(documents, k=TOP_K)
+    if backend == "lexical":
+        return lexical
+
+    vector = create_vector_retriever(create_chroma_store(documents))
+    ensemble = EnsembleRetriever(retrievers=[lexical, vector], weights=[0.5, 0.5])
+    return TopKRetriever(retriever=ensemble, k=TOP_K)
+
+
+def create_chatbot(vector_store=None, retriever=None):
+    """
+    Creates a chatbot for querying the Chroma vector store or a given retriever.
+    Args:
+        vector_store (Chroma): The vector store to use.
+        retriever (BaseRetriever): A retriever to use instead of the vector store.
     Returns:
         RetrievalQA: The QA chatbot object.
+    Raises:
+        ValueError: If neither a vector store nor a retriever is provided.
     """
+    if retriever is None:
+        if vector_store is None:
+            raise ValueError("Either a vector store or a retriever must be provided to create the chatbot.")
+        retriever = create_vector_retriever(vector_store)
+
     llm = OpenAI(temperature=0.5)
-    retriever = vector_store.as_retriever(search_type="mmr", k=5)
-    
+
     qa = RetrievalQA.from_chain_type(
         llm=llm,
-        chain_type="stuff", 
+        chain_type="stuff",
         retriever=retriever,
-        return_source_documents=True
+        return_source_documents=True,
+        chain_type_kwargs={"prompt": QA_PROMPT}
     )
     return qa
 
@@ -0,0 +1,43 @@
+from langchain_core.documents import Document
+
+from modules.bm25_retriever import BM25Retriever, tokenize
+
+
+def make_documents(*texts):
+    return [Document(page_content=text, metadata={"position": i}) for i, text in enumerate(texts)]
+
+
+def test_tokenize_lowercases_and_drops_punctuation():
+    assert tokenize("Tata Motors' CEO: N. Chandrasekaran!") == ["tata", "motors", "ceo", "n", "chandrasekaran"]
+
+
+def test_relevant_document_ranks_first():
+    documents = make_documents(
+        "Mahindra reports quarterly sales figures for tractors.",
+        "Anish Shah is the CEO of Mahindra Group since 2021.",
+        "Mahindra launches a new electric SUV in India.",
+    )
+    retriever = BM25Retriever.from_documents(documents, k=1)
+
+    assert retriever.invoke("CEO of Mahindra") == [documents[1]]
+
+
+def test_zero_overlap_query_falls_back_to_document_order():
+    documents = make_documents("alpha beta", "gamma delta", "epsilon zeta")
+    retriever = BM25Retriever.from_documents(documents, k=2)
+
+    assert retriever.invoke("unrelated words") == documents[:2]
+
+
+def test_k_is_respected():
+    documents = make_documents(*[f"snippet number {i} about maruti" for i in range(10)])
+
+    assert len(BM25Retriever.from_documents(documents, k=3).invoke("maruti")) == 3
+    assert len(BM25Retriever.from_documents(documents, k=20).invoke("maruti")) == 10
+
+
+def test_punctuation_only_documents_do_not_crash():
+    documents = make_documents("...", "!?", "--")
+    retriever = BM25Retriever.from_documents(documents, k=2)
+
+    assert retriever.invoke("anything") == documents[:2]
@@ -0,0 +1,56 @@
+import pytest
+from langchain_core.documents import Document
+
+from modules import qa_chatbot
+from modules.bm25_retriever import BM25Retriever
+
+
+def make_data(count):
+    return [
+        {"position": i, "title": f"Result {i}", "link": f"https://example.com/{i}", "snippet": f"Snippet {i} about the CEO of Mahindra"}
+        for i in range(count)
+    ]
+
+
+class FakeVectorStore:
+    """Stands in for Chroma by serving its own documents through BM25."""
+
+    def __init__(self, documents):
+        self.documents = [Document(page_content=f"vector {doc.page_content}") for doc in documents]
+
+    def as_retriever(self, search_type, search_kwargs):
+        return BM25Retriever.from_documents(self.documents, k=search_kwargs["k"])
+
+
+@pytest.fixture
+def no_chroma(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("The lexical backend must not create a Chroma store.")
+
+    monkeypatch.setattr(qa_chatbot, "process_safety_with_chroma", fail)
+    monkeypatch.setattr(qa_chatbot, "create_chroma_store", fail)
+
+
+def test_lexical_backend_never_touches_chroma(no_chroma):
+    retriever = qa_chatbot.create_retriever(make_data(10), backend="lexical")
+
+    assert isinstance(retriever, BM25Retriever)
+    assert len(retriever.invoke("CEO of Mahindra")) == qa_chatbot.TOP_K
+
+
+def test_hybrid_backend_is_capped_at_top_k(monkeypatch):
+    monkeypatch.setattr(qa_chatbot, "create_chroma_store", FakeVectorStore)
+
+    retriever = qa_chatbot.create_retriever(make_data(10), backend="hybrid")
+
+    assert len(retriever.invoke("CEO of Mahindra")) == qa_chatbot.TOP_K
+
+
+def test_unsupported_backend_raises(no_chroma):
+    with pytest.raises(ValueError, match="Unsupported retriever backend 'bm25'"):
+        qa_chatbot.create_retriever(make_data(3), backend="bm25")
+
+
+def test_create_chatbot_requires_vector_store_or_retriever():
+    with pytest.raises(ValueError, match="Either a vector store or a retriever"):
+        qa_chatbot.create_chatbot()